@@ -128,6 +128,7 @@ from kasa.exceptions import (
 from kasa.iot.iotdevice import IotDevice, _extract_sys_info
 from kasa.json import DataClassJSONMixin
 from kasa.json import dumps as json_dumps
+from kasa.json import dumps_bytes as json_dumps_bytes
 from kasa.json import loads as json_loads
 from kasa.protocols.iotprotocol import REDACTORS as IOT_REDACTORS
 from kasa.protocols.protocol import mask_mac, redact_data
@@ -201,7 +202,7 @@ class _AesDiscoveryQuery:
 
         key_payload = {"params": {"rsa_key": cls.keypair.get_public_pem().decode()}}
 
-        key_payload_bytes = json_dumps(key_payload).encode()
+        key_payload_bytes = json_dumps_bytes(key_payload)
         # https://labs.withsecure.com/advisories/tp-link-ac1750-pwn2own-2019
         version = 2  # version of tdp
         msg_type = 0
@@ -278,6 +279,21 @@ class _DiscoverProtocol(asyncio.DatagramProtocol):
         self.callback_tasks: list[asyncio.Task] = []
         self.target_discovered: bool = False
         self._started_event = asyncio.Event()
+        self._response_handlers: dict[
+            int,
+            tuple[Callable[[bytes, str], dict], Callable[[dict, DeviceConfig], Device]],
+        ] = {
+            Discover.DISCOVERY_PORT_2: (
+                Discover._get_discovery_json,
+                Discover._get_device_instance,
+            ),
+            # Legacy entry last so it takes precedence if the discovery
+            # port is overridden to DISCOVERY_PORT_2
+            self.discovery_port: (
+                Discover._get_discovery_json_legacy,
+                Discover._get_device_instance_legacy,
+            ),
+        }
 
     def _run_callback_task(self, coro: Coroutine) -> None:
         task: asyncio.Task = asyncio.create_task(coro)
@@ -324,14 +340,15 @@ class _DiscoverProtocol(asyncio.DatagramProtocol):
         """Send number of discovery datagrams."""
         req = json_dumps(Discover.DISCOVERY_QUERY)
         _LOGGER.debug("[DISCOVERY] %s >> %s", self.target, Discover.DISCOVERY_QUERY)
-        encrypted_req = XorEncryption.encrypt(req)
+        # Discovery datagrams are sent without the length header
+        legacy_discovery_query = XorEncryption.encrypt(req)[4:]
         sleep_between_packets = self.discovery_timeout / self.discovery_packets
 
         aes_discovery_query = _AesDiscoveryQuery.generate_query()
         for _ in range(self.discovery_packets):
             if self.target in self.seen_hosts:  # Stop sending for discover_single
                 break
-            self.transport.sendto(encrypted_req[4:], self.target_1)  # type: ignore
+            self.transport.sendto(legacy_discovery_query, self.target_1)  # type: ignore
             self.transport.sendto(aes_discovery_query, self.target_2)  # type: ignore
             await asyncio.sleep(sleep_between_packets)
 
@@ -350,6 +367,10 @@ class _DiscoverProtocol(asyncio.DatagramProtocol):
             return
         self.seen_hosts.add(ip)
 
+        if (handlers := self._response_handlers.get(port)) is None:
+            return
+        json_func, device_func = handlers
+
         device: Device | None = None
 
         config = DeviceConfig(host=ip, port_override=self.port)
@@ -358,14 +379,6 @@ class _DiscoverProtocol(asyncio.DatagramProtocol):
         if self.timeout:
             config.timeout = self.timeout
         try:
-            if port == self.discovery_port:
-                json_func = Discover._get_discovery_json_legacy
-                device_func = Discover._get_device_instance_legacy
-            elif port == Discover.DISCOVERY_PORT_2:
-                json_func = Discover._get_discovery_json
-                device_func = Discover._get_device_instance
-            else:
-                return
             info = json_func(data, ip)
             if self.on_discovered_raw is not None:
                 self.on_discovered_raw(
@@ -117,7 +117,7 @@ class HttpClient:
 
             if resp.status == 200:
                 if return_json:
-                    response_data = json_loads(response_data.decode())
+                    response_data = json_loads(response_data)
             else:
                 _LOGGER.debug(
                     "Device %s received status code %s with response %s",
@@ -127,7 +127,7 @@ class HttpClient:
                 )
                 if response_data and return_json:
                     try:
-                        response_data = json_loads(response_data.decode())
+                        response_data = json_loads(response_data)
                     except Exception:
                         _LOGGER.debug("Device %s response could not be parsed as json")
 
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from ..device_type import DeviceType
 from ..deviceconfig import DeviceConfig
@@ -26,9 +28,9 @@ from .modules import Antitheft, Cloud, Countdown, Emeter, Led, Schedule, Time, U
 _LOGGER = logging.getLogger(__name__)
 
 
-def merge_sums(dicts: list[dict]) -> dict:
+def merge_sums(dicts: Iterable[dict]) -> dict:
     """Merge the sum of dicts."""
-    total_dict: defaultdict[int, float] = defaultdict(lambda: 0.0)
+    total_dict: defaultdict[Any, float] = defaultdict(float)
     for sum_dict in dicts:
         for day, value in sum_dict.items():
             total_dict[day] += value
@@ -98,6 +100,8 @@ class IotStrip(IotDevice):
         super().__init__(host=host, config=config, protocol=protocol)
         self.emeter_type = "emeter"
         self._device_type = DeviceType.Strip
+        self._children_by_id: dict[str, dict] = {}
+        self._any_on = False
 
     async def _initialize_modules(self) -> None:
         """Initialize modules."""
@@ -115,11 +119,18 @@ class IotStrip(IotDevice):
             )
             self.add_module(Module.Energy, StripEmeter(self, self.emeter_type))
 
+    def _set_sys_info(self, sys_info: dict[str, Any]) -> None:
+        """Set sys_info and index the child information by id."""
+        super()._set_sys_info(sys_info)
+        children = sys_info.get("children", [])
+        self._children_by_id = {child["id"]: child for child in children}
+        self._any_on = any(child["state"] for child in children)
+
     @property  # type: ignore
     @requires_update
     def is_on(self) -> bool:
         """Return if any of the outlets are on."""
-        return any(plug.is_on for plug in self.children)
+        return self._any_on
 
     async def update(self, update_children: bool = True) -> None:
         """Update some of the attributes.
@@ -142,6 +153,9 @@ class IotStrip(IotDevice):
             }
             for child in self._children.values():
                 await child._initialize_modules()
+            strip_energy = self.modules.get(Module.Energy)
+            if isinstance(strip_energy, StripEmeter):
+                strip_energy._reset_child_modules()
 
         if update_children:
             for plug in self.children:
@@ -159,18 +173,23 @@ class IotStrip(IotDevice):
             return
         await super()._initialize_features()
 
+    async def _set_children_state(self, on: bool) -> None:
+        """Switch all outlets not yet in the wanted state with a single request."""
+        plugs = cast(Sequence[IotStripPlug], self.children)
+        child_ids = [plug.child_id for plug in plugs if plug.is_on is not on]
+        if child_ids:
+            await self._query_helper(
+                "system", "set_relay_state", {"state": int(on)}, child_ids=child_ids
+            )
+
     async def turn_on(self, **kwargs) -> dict:
         """Turn the strip on."""
-        for plug in self.children:
-            if plug.is_off:
-                await plug.turn_on()
+        await self._set_children_state(True)
         return {}
 
     async def turn_off(self, **kwargs) -> dict:
         """Turn the strip off."""
-        for plug in self.children:
-            if plug.is_on:
-                await plug.turn_off()
+        await self._set_children_state(False)
         return {}
 
     @property  # type: ignore
@@ -180,7 +199,22 @@ class IotStrip(IotDevice):
         if self.is_off:
             return None
 
-        return min(plug.on_since for plug in self.children if plug.on_since is not None)
+        device_time = self.time
+        plugs = cast(Sequence[IotStripPlug], self.children)
+        return min(
+            on_since
+            for plug in plugs
+            if (on_since := plug._get_on_since(device_time)) is not None
+        )
+
+
+class _EnergyTotals(NamedTuple):
+    """Energy readings summed over all outlets."""
+
+    current_consumption: float
+    consumption_this_month: float
+    consumption_today: float
+    consumption_total: float
 
 
 class StripEmeter(IotModule, Energy):
@@ -192,6 +226,15 @@ class StripEmeter(IotModule, Energy):
         | Energy.ModuleFeature.VOLTAGE_CURRENT
     )
 
+    #: Seconds for which summed daily and monthly statistics are reused
+    STATS_CACHE_SECS = 60
+
+    def __init__(self, device: IotDevice, module: str) -> None:
+        super().__init__(device, module)
+        self._totals: _EnergyTotals | None = None
+        self._child_modules: list[Emeter] | None = None
+        self._stats_cache: dict[tuple, tuple[float, dict]] = {}
+
     def supports(self, module_feature: Energy.ModuleFeature) -> bool:
         """Return True if module supports the feature."""
         return module_feature in self._supported
@@ -200,13 +243,40 @@ class StripEmeter(IotModule, Energy):
         """Return the base query."""
         return {}
 
+    def _reset_child_modules(self) -> None:
+        """Forget the outlet energy modules after the outlets have changed."""
+        self._child_modules = None
+
+    def _reset_totals(self) -> None:
+        """Forget the summed outlet readings after an outlet has updated."""
+        self._totals = None
+
+    def _get_child_modules(self) -> list[Emeter]:
+        """Return the energy modules of the outlets."""
+        if self._child_modules is None:
+            self._child_modules = [
+                cast(Emeter, plug.modules[Module.Energy])
+                for plug in self._device.children
+            ]
+        return self._child_modules
+
+    def _get_totals(self) -> _EnergyTotals:
+        """Return the summed outlet readings, computed once per update."""
+        if self._totals is None:
+            current = this_month = today = total = 0.0
+            for energy in self._get_child_modules():
+                snapshot = energy._energy_snapshot()
+                current += snapshot["current_consumption"] or 0.0
+                this_month += snapshot["consumption_this_month"] or 0.0
+                today += snapshot["consumption_today"] or 0.0
+                total += snapshot["consumption_total"] or 0.0
+            self._totals = _EnergyTotals(current, this_month, today, total)
+        return self._totals
+
     @property
     def current_consumption(self) -> float | None:
         """Get the current power consumption in watts."""
-        return sum(
-            v if (v := plug.modules[Module.Energy].current_consumption) else 0.0
-            for plug in self._device.children
-        )
+        return self._get_totals().current_consumption
 
     async def get_status(self) -> EmeterStatus:
         """Retrieve current energy readings."""
@@ -214,7 +284,7 @@ class StripEmeter(IotModule, Energy):
         # Voltage is averaged since each read will result
         # in a slightly different voltage since they are not atomic
         emeter_rt["voltage_mv"] = int(
-            emeter_rt["voltage_mv"] / len(self._device.children)
+            emeter_rt["voltage_mv"] / len(self._get_child_modules())
         )
         return EmeterStatus(emeter_rt)
 
@@ -229,7 +299,11 @@ class StripEmeter(IotModule, Energy):
         :param kwh: return usage in kWh (default: True)
         :return: mapping of day of month to value
         """
-        return await self._async_get_emeter_sum(
+        # Resolve the defaults so a cached result never outlives its period
+        today = datetime.now()
+        year = today.year if year is None else year
+        month = today.month if month is None else month
+        return await self._async_get_cached_stats(
             "get_daily_stats", {"year": year, "month": month, "kwh": kwh}
         )
 
@@ -241,7 +315,8 @@ class StripEmeter(IotModule, Energy):
         :param year: year for which to retrieve statistics (default: this year)
         :param kwh: return usage in kWh (default: True)
         """
-        return await self._async_get_emeter_sum(
+        year = datetime.now().year if year is None else year
+        return await self._async_get_cached_stats(
             "get_monthly_stats", {"year": year, "kwh": kwh}
         )
 
@@ -249,51 +324,60 @@ class StripEmeter(IotModule, Energy):
         """Retrieve emeter stats for a time period from children."""
         return merge_sums(
             [
-                await getattr(plug.modules[Module.Energy], func)(**kwargs)
-                for plug in self._device.children
+                await getattr(energy, func)(**kwargs)
+                for energy in self._get_child_modules()
             ]
         )
 
+    async def _async_get_cached_stats(self, func: str, kwargs: dict[str, Any]) -> dict:
+        """Retrieve summed stats, reusing results fetched within the cache time."""
+        key = (func, *kwargs.values())
+        now = time.monotonic()
+        if (cached := self._stats_cache.get(key)) and (
+            now - cached[0] < self.STATS_CACHE_SECS
+        ):
+            return cached[1].copy()
+
+        stats = await self._async_get_emeter_sum(func, kwargs)
+        self._stats_cache = {
+            cached_key: cached
+            for cached_key, cached in self._stats_cache.items()
+            if now - cached[0] < self.STATS_CACHE_SECS
+        }
+        self._stats_cache[key] = (now, stats)
+        return stats.copy()
+
     async def erase_stats(self) -> dict:
         """Erase energy meter statistics for all plugs."""
-        for plug in self._device.children:
-            await plug.modules[Module.Energy].erase_stats()
+        self._stats_cache.clear()
+        for energy in self._get_child_modules():
+            await energy.erase_stats()
 
         return {}
 
     @property  # type: ignore
     def consumption_this_month(self) -> float | None:
         """Return this month's energy consumption in kWh."""
-        return sum(
-            v if (v := plug.modules[Module.Energy].consumption_this_month) else 0.0
-            for plug in self._device.children
-        )
+        return self._get_totals().consumption_this_month
 
     @property  # type: ignore
     def consumption_today(self) -> float | None:
         """Return this month's energy consumption in kWh."""
-        return sum(
-            v if (v := plug.modules[Module.Energy].consumption_today) else 0.0
-            for plug in self._device.children
-        )
+        return self._get_totals().consumption_today
 
     @property  # type: ignore
     def consumption_total(self) -> float | None:
         """Return total energy consumption since reboot in kWh."""
-        return sum(
-            v if (v := plug.modules[Module.Energy].consumption_total) else 0.0
-            for plug in self._device.children
-        )
+        return self._get_totals().consumption_total
 
     @property  # type: ignore
     def status(self) -> EmeterStatus:
         """Return current energy readings."""
-        emeter = merge_sums(
-            [plug.modules[Module.Energy].status for plug in self._device.children]
-        )
+        modules = self._get_child_modules()
+        emeter = merge_sums(energy.status for energy in modules)
         # Voltage is averaged since each read will result
         # in a slightly different voltage since they are not atomic
-        emeter["voltage_mv"] = int(emeter["voltage_mv"] / len(self._device.children))
+        emeter["voltage_mv"] = int(emeter["voltage_mv"] / len(modules))
         return EmeterStatus(emeter)
 
     @property
@@ -320,14 +404,16 @@ class IotStripPlug(IotPlug):
     _parent: IotStrip
 
     def __init__(self, host: str, parent: IotStrip, child_id: str) -> None:
-        super().__init__(host)
+        # Must use the same connection as the parent
+        super().__init__(host, protocol=parent.protocol)
 
         self._parent = parent
         self.child_id = child_id
         self._last_update = parent._last_update
         self._set_sys_info(parent.sys_info)
         self._device_type = DeviceType.StripSocket
-        self.protocol = parent.protocol  # Must use the same connection as the parent
+        self._device_id = f"{self.mac}_{child_id}"
+        self._model = f"Socket for {parent.sys_info['model']}"
         self._on_since: datetime | None = None
 
     async def _initialize_modules(self) -> None:
@@ -386,6 +472,10 @@ class IotStripPlug(IotPlug):
         for module in self._modules.values():
             await module._post_update_hook()
 
+        strip_energy = self._parent.modules.get(Module.Energy)
+        if isinstance(strip_energy, StripEmeter):
+            strip_energy._reset_totals()
+
         if not self._features:
             await self._initialize_features()
 
@@ -437,7 +527,7 @@ class IotStripPlug(IotPlug):
 
         This is a combination of MAC and child's ID.
         """
-        return f"{self.mac}_{self.child_id}"
+        return self._device_id
 
     @property  # type: ignore
     @requires_update
@@ -457,6 +547,10 @@ class IotStripPlug(IotPlug):
     @requires_update
     def on_since(self) -> datetime | None:
         """Return on-time, if available."""
+        return self._get_on_since(self._parent.time)
+
+    def _get_on_since(self, device_time: datetime) -> datetime | None:
+        """Return on-time relative to the given device time."""
         if self.is_off:
             self._on_since = None
             return None
@@ -464,9 +558,7 @@ class IotStripPlug(IotPlug):
         info = self._get_child_info()
         on_time = info["on_time"]
 
-        time = self._parent.time
-
-        on_since = time - timedelta(seconds=on_time)
+        on_since = device_time - timedelta(seconds=on_time)
         if not self._on_since or timedelta(
             seconds=0
         ) < on_since - self._on_since > timedelta(seconds=5):
@@ -477,15 +569,11 @@ class IotStripPlug(IotPlug):
     @requires_update
     def model(self) -> str:
         """Return device model for a child socket."""
-        sys_info = self._parent.sys_info
-        return f"Socket for {sys_info['model']}"
+        return self._model
 
     def _get_child_info(self) -> dict:
         """Return the subdevice information for this device."""
-        for plug in self._parent.sys_info["children"]:
-            if plug["id"] == self.child_id:
-                return plug
-
-        raise KasaException(
-            f"Unable to find children {self.child_id}"
-        )  # pragma: no cover
+        try:
+            return self._parent._children_by_id[self.child_id]
+        except KeyError as ex:  # pragma: no cover
+            raise KasaException(f"Unable to find children {self.child_id}") from ex
@@ -37,16 +37,24 @@ class Emeter(Usage, EnergyInterface):
     @property
     def consumption_today(self) -> float | None:
         """Return today's energy consumption in kWh."""
-        raw_data = self.daily_data
-        today = datetime.now().day
-        data = self._convert_stat_data(raw_data, entry_key="day", key=today)
-        return data.get(today, 0.0)
+        return self._consumption_today(datetime.now())
 
     @property
     def consumption_this_month(self) -> float | None:
         """Return this month's energy consumption in kWh."""
+        return self._consumption_this_month(datetime.now())
+
+    def _consumption_today(self, now: datetime) -> float:
+        """Return the energy consumption in kWh for the day of *now*."""
+        raw_data = self.daily_data
+        today = now.day
+        data = self._convert_stat_data(raw_data, entry_key="day", key=today)
+        return data.get(today, 0.0)
+
+    def _consumption_this_month(self, now: datetime) -> float:
+        """Return the energy consumption in kWh for the month of *now*."""
         raw_data = self.monthly_data
-        current_month = datetime.now().month
+        current_month = now.month
         data = self._convert_stat_data(raw_data, entry_key="month", key=current_month)
         return data.get(current_month, 0.0)
 
@@ -60,6 +68,17 @@ class Emeter(Usage, EnergyInterface):
         """Return total consumption since last reboot in kWh."""
         return self.status.total
 
+    def _energy_snapshot(self) -> dict[str, float | None]:
+        """Return the consumption readings without separate property lookups."""
+        status = self.status
+        now = datetime.now()
+        return {
+            "current_consumption": status.power,
+            "consumption_this_month": self._consumption_this_month(now),
+            "consumption_today": self._consumption_today(now),
+            "consumption_total": status.total,
+        }
+
     @property
     def current(self) -> float | None:
         """Return the current in A."""
@@ -16,6 +16,10 @@ try:
             obj, option=orjson.OPT_INDENT_2 if indent else None
         ).decode()
 
+    def dumps_bytes(obj: Any) -> bytes:
+        """Dump JSON as utf-8 encoded bytes."""
+        return orjson.dumps(obj)
+
     loads = orjson.loads
 except ImportError:
     import json
@@ -27,6 +31,10 @@ except ImportError:
         # Separators specified for consistency with orjson
         return json.dumps(obj, separators=(",", ":"), indent=2 if indent else None)
 
+    def dumps_bytes(obj: Any) -> bytes:
+        """Dump JSON as utf-8 encoded bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
     loads = json.loads
 
 
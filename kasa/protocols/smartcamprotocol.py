@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass
-from pprint import pformat as pf
+from functools import lru_cache
 from typing import Any, cast
 
 from ..exceptions import (
@@ -23,17 +24,22 @@ from .smartprotocol import SmartProtocol
 
 _LOGGER = logging.getLogger(__name__)
 
+# Position before each uppercase letter except at the start of a name
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
 # List of getMethodNames that should be sent as {"method":"do"}
 # https://md.depau.eu/s/r1Ys_oWoP#Modules
-GET_METHODS_AS_DO = {
-    "getSdCardFormatStatus",
-    "getConnectionType",
-    "getUserID",
-    "getP2PSharePassword",
-    "getAESEncryptKey",
-    "getFirmwareAFResult",
-    "getWhitelampStatus",
-}
+GET_METHODS_AS_DO = frozenset(
+    {
+        "getSdCardFormatStatus",
+        "getConnectionType",
+        "getUserID",
+        "getP2PSharePassword",
+        "getAESEncryptKey",
+        "getFirmwareAFResult",
+        "getWhitelampStatus",
+    }
+)
 
 
 @dataclass
@@ -95,51 +101,44 @@ class SmartCamProtocol(SmartProtocol):
     def _get_smart_camera_single_request(
         request: dict[str, dict[str, Any]],
     ) -> SingleRequest:
-        method = next(iter(request))
+        ((method, params),) = request.items()
         if method == "multipleRequest":
-            method_type = "multi"
-            params = request["multipleRequest"]
             req = {"method": "multipleRequest", "params": params}
             return SingleRequest("multi", "multipleRequest", "", req)
 
-        param = next(iter(request[method]))
-        method_type = method
+        param, param_value = next(iter(params.items()))
         req = {
             "method": method,
-            param: request[method][param],
+            param: param_value,
         }
-        return SingleRequest(method_type, method, param, req)
+        return SingleRequest(method, method, param, req)
 
     @staticmethod
     def _make_snake_name(name: str) -> str:
         """Convert camel or pascal case to snake name."""
-        sn = "".join(["_" + i.lower() if i.isupper() else i for i in name]).lstrip("_")
-        return sn
+        return _CAMEL_CASE_BOUNDARY.sub("_", name).lower().lstrip("_")
 
     @staticmethod
-    def _make_smart_camera_single_request(
-        request: str,
-    ) -> SingleRequest:
-        """Make a single request given a method name and no params.
+    @lru_cache
+    def _get_method_type_and_param(method: str) -> tuple[str, str]:
+        """Return the method type and param name for a method name.
 
         If method like getSomeThing then module will be some_thing.
         """
-        method = request
-        method_type = request[:3]
-        snake_name = SmartCamProtocol._make_snake_name(request)
-        param = snake_name[4:]
-        if (
-            (short_method := method[:3])
-            and short_method in {"get", "set"}
-            and method not in GET_METHODS_AS_DO
-        ):
-            method_type = short_method
-            param = snake_name[4:]
-        else:
-            method_type = "do"
-            param = snake_name
+        snake_name = SmartCamProtocol._make_snake_name(method)
+        short_method = method[:3]
+        if short_method in {"get", "set"} and method not in GET_METHODS_AS_DO:
+            return short_method, snake_name[4:]
+        return "do", snake_name
+
+    @staticmethod
+    def _make_smart_camera_single_request(
+        request: str,
+    ) -> SingleRequest:
+        """Make a single request given a method name and no params."""
+        method_type, param = SmartCamProtocol._get_method_type_and_param(request)
         req = {"method": method_type, param: {}}
-        return SingleRequest(method_type, method, param, req)
+        return SingleRequest(method_type, request, param, req)
 
     async def _execute_query(
         self, request: str | dict, *, retry_count: int, iterate_list_pages: bool = True
@@ -161,7 +160,7 @@ class SmartCamProtocol(SmartProtocol):
             _LOGGER.debug(
                 "%s >> %s",
                 self._host,
-                pf(smart_request),
+                smart_request,
             )
         response_data = await self._transport.send(smart_request)
 
@@ -169,7 +168,7 @@ class SmartCamProtocol(SmartProtocol):
             _LOGGER.debug(
                 "%s << %s",
                 self._host,
-                pf(response_data),
+                json_dumps(response_data, indent=True),
             )
 
         if "error_code" in response_data:
@@ -178,7 +177,9 @@ class SmartCamProtocol(SmartProtocol):
         # Requests that are invalid and raise PROTOCOL_FORMAT_ERROR when sent
         # as a multipleRequest will return {} when sent as a single request.
         if single_request.method_type == "get" and (
-            not (section := next(iter(response_data))) or response_data[section] == {}
+            not response_data
+            or not (section := next(iter(response_data)))
+            or response_data[section] == {}
         ):
             raise DeviceError(
                 f"No results for get request {single_request.method_name}"
@@ -223,20 +224,19 @@ class _ChildCameraProtocolWrapper(SmartProtocol):
         """Wrap request inside controlChild envelope."""
         if not isinstance(request, dict):
             raise KasaException("Child requests must be dictionaries.")
-        requests = []
-        methods = []
-        for key, val in request.items():
-            request = {
+        methods = list(request)
+        requests = [
+            {
                 "method": "controlChild",
                 "params": {
                     "childControl": {
                         "device_id": self._device_id,
-                        "request_data": {"method": key, "params": val},
+                        "request_data": {"method": method, "params": params},
                     }
                 },
             }
-            methods.append(key)
-            requests.append(request)
+            for method, params in request.items()
+        ]
 
         multipleRequest = {"multipleRequest": {"requests": requests}}
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from ...exceptions import DeviceError
 from ...feature import Feature
 from ..smartmodule import SmartModule
 
@@ -31,6 +32,8 @@ class Cloud(SmartModule):
     @property
     def is_connected(self) -> bool:
         """Return True if device is connected to the cloud."""
-        if self._has_data_error():
+        try:
+            data = self.data
+        except DeviceError:
             return False
-        return self.data["status"] == 0
+        return data["status"] == 0
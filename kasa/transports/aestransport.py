@@ -35,6 +35,7 @@ from kasa.exceptions import (
 )
 from kasa.httpclient import HttpClient
 from kasa.json import dumps as json_dumps
+from kasa.json import dumps_bytes as json_dumps_bytes
 from kasa.json import loads as json_loads
 
 from .basetransport import BaseTransport
@@ -94,9 +95,9 @@ class AesTransport(BaseTransport):
             self._login_params = self._get_login_params(self._credentials)
         else:
             self._login_params = json_loads(
-                base64.b64decode(self._credentials_hash.encode()).decode()  # type: ignore[union-attr]
+                base64.b64decode(self._credentials_hash.encode())  # type: ignore[union-attr]
             )
-        self._default_credentials: Credentials | None = None
+        self._default_login_params: dict[str, str] | None = None
         self._http_client: HttpClient = HttpClient(config)
 
         self._state = TransportState.HANDSHAKE_REQUIRED
@@ -129,7 +130,7 @@ class AesTransport(BaseTransport):
         """The hashed credentials used by the transport."""
         if self._credentials == Credentials():
             return None
-        return base64.b64encode(json_dumps(self._login_params).encode()).decode()
+        return base64.b64encode(json_dumps_bytes(self._login_params)).decode()
 
     def _get_login_params(self, credentials: Credentials) -> dict[str, str]:
         """Get the login parameters based on the login_version."""
@@ -238,12 +239,12 @@ class AesTransport(BaseTransport):
                     "%s: trying login with default TAPO credentials",
                     self._host,
                 )
-                if self._default_credentials is None:
-                    self._default_credentials = get_default_credentials(
-                        DEFAULT_CREDENTIALS["TAPO"]
+                if self._default_login_params is None:
+                    self._default_login_params = self._get_login_params(
+                        get_default_credentials(DEFAULT_CREDENTIALS["TAPO"])
                     )
                 await self.perform_handshake()
-                await self.try_login(self._get_login_params(self._default_credentials))
+                await self.try_login(self._default_login_params)
                 _LOGGER.debug(
                     "%s: logged in with default TAPO credentials",
                     self._host,
@@ -295,7 +296,7 @@ class AesTransport(BaseTransport):
         handshake_params = {"key": pub_key}
         request_body = {"method": "handshake", "params": handshake_params}
         _LOGGER.debug("Handshake request: %s", request_body)
-        yield json_dumps(request_body).encode()
+        yield json_dumps_bytes(request_body)
 
     async def perform_handshake(self) -> None:
         """Perform the handshake."""
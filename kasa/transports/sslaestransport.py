@@ -27,6 +27,7 @@ from ..exceptions import (
 )
 from ..httpclient import HttpClient
 from ..json import dumps as json_dumps
+from ..json import dumps_bytes as json_dumps_bytes
 from ..json import loads as json_loads
 from . import AesEncyptionSession, BaseTransport
 
@@ -140,7 +141,7 @@ class SslAesTransport(BaseTransport):
     @staticmethod
     def _create_b64_credentials(credentials: Credentials) -> str:
         ch = {"un": credentials.username, "pwd": credentials.password}
-        return base64.b64encode(json_dumps(ch).encode()).decode()
+        return base64.b64encode(json_dumps_bytes(ch)).decode()
 
     @property
     def credentials_hash(self) -> str | None:
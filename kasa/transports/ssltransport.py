@@ -28,7 +28,7 @@ from kasa.exceptions import (
     _RetryableError,
 )
 from kasa.httpclient import HttpClient
-from kasa.json import dumps as json_dumps
+from kasa.json import dumps_bytes as json_dumps_bytes
 from kasa.json import loads as json_loads
 from kasa.transports import BaseTransport
 
@@ -74,14 +74,20 @@ class SslTransport(BaseTransport):
         ) and not self._credentials_hash:
             self._credentials = Credentials()
 
+        # The login params never change after init so serialize them only once
         if self._credentials:
             self._login_params = self._get_login_params(self._credentials)
+            self._login_params_hash = base64.b64encode(
+                json_dumps_bytes(self._login_params)
+            ).decode()
         else:
+            self._login_params_hash = cast(str, self._credentials_hash)
             self._login_params = json_loads(
-                base64.b64decode(self._credentials_hash.encode()).decode()  # type: ignore[union-attr]
+                base64.b64decode(self._login_params_hash.encode())
             )
+        self._login_request = self._get_login_request(self._login_params)
 
-        self._default_credentials: Credentials | None = None
+        self._default_login_params: dict[str, str] | None = None
         self._http_client: HttpClient = HttpClient(config)
 
         self._state = TransportState.LOGIN_REQUIRED
@@ -101,13 +107,18 @@ class SslTransport(BaseTransport):
     @property
     def credentials_hash(self) -> str:
         """The hashed credentials used by the transport."""
-        return base64.b64encode(json_dumps(self._login_params).encode()).decode()
+        return self._login_params_hash
 
     def _get_login_params(self, credentials: Credentials) -> dict[str, str]:
         """Get the login parameters based on the login_version."""
         un, pw = self.hash_credentials(credentials)
         return {"password": pw, "username": un}
 
+    @staticmethod
+    def _get_login_request(login_params: dict[str, Any]) -> bytes:
+        """Get the serialized login request for the login params."""
+        return json_dumps_bytes({"method": "login", "params": login_params})
+
     @staticmethod
     def hash_credentials(credentials: Credentials) -> tuple[str, str]:
         """Hash the credentials."""
@@ -117,8 +128,8 @@ class SslTransport(BaseTransport):
 
     async def _handle_response_error_code(self, resp_dict: Any, msg: str) -> None:
         """Handle response errors to request reauth etc."""
-        error_code = SmartErrorCode(resp_dict.get("error_code"))  # type: ignore[arg-type]
-        if error_code == SmartErrorCode.SUCCESS:
+        error_code = SmartErrorCode.from_int(resp_dict.get("error_code"))
+        if error_code is SmartErrorCode.SUCCESS:
             return
 
         msg = f"{msg}: {self._host}: {error_code.name}({error_code.value})"
@@ -132,7 +143,9 @@ class SslTransport(BaseTransport):
 
         raise DeviceError(msg, error_code=error_code)
 
-    async def send_request(self, request: str) -> dict[str, Any]:
+    async def send_request(
+        self, request: str | bytes, error_msg: str = "Error sending request"
+    ) -> dict[str, Any]:
         """Send request."""
         url = self._app_url
 
@@ -152,7 +165,7 @@ class SslTransport(BaseTransport):
 
         _LOGGER.debug("Response with %s: %r", status_code, resp_dict)
 
-        await self._handle_response_error_code(resp_dict, "Error sending request")
+        await self._handle_response_error_code(resp_dict, error_msg)
 
         if TYPE_CHECKING:
             resp_dict = cast(dict[str, Any], resp_dict)
@@ -169,13 +182,13 @@ class SslTransport(BaseTransport):
                     raise aex
 
                 _LOGGER.debug("Login failed, going to try default credentials")
-                if self._default_credentials is None:
-                    self._default_credentials = get_default_credentials(
-                        DEFAULT_CREDENTIALS["TAPO"]
+                if self._default_login_params is None:
+                    self._default_login_params = self._get_login_params(
+                        get_default_credentials(DEFAULT_CREDENTIALS["TAPO"])
                     )
                     await asyncio.sleep(self.BACKOFF_SECONDS_AFTER_LOGIN_ERROR)
 
-                await self.try_login(self._get_login_params(self._default_credentials))
+                await self.try_login(self._default_login_params)
                 _LOGGER.debug(
                     "%s: logged in with default credentials",
                     self._host,
@@ -191,15 +204,13 @@ class SslTransport(BaseTransport):
 
     async def try_login(self, login_params: dict[str, Any]) -> None:
         """Try to login with supplied login_params."""
-        login_request = {
-            "method": "login",
-            "params": login_params,
-        }
-        request = json_dumps(login_request)
+        if login_params is self._login_params:
+            request = self._login_request
+        else:
+            request = self._get_login_request(login_params)
         _LOGGER.debug("Going to send login request")
 
-        resp_dict = await self.send_request(request)
-        await self._handle_response_error_code(resp_dict, "Error logging in")
+        resp_dict = await self.send_request(request, "Error logging in")
 
         login_token = resp_dict["result"]["token"]
         self._app_url = self._app_url.with_query(f"token={login_token}")
@@ -230,6 +241,10 @@ class SslTransport(BaseTransport):
         await self._http_client.close()
 
     async def reset(self) -> None:
-        """Reset internal login state."""
+        """Reset internal login state.
+
+        The http client is left open so the pooled connection to the device
+        is reused when logging in again.
+        """
         self._state = TransportState.LOGIN_REQUIRED
         self._app_url = URL(f"https://{self._host}:{self._port}/app")
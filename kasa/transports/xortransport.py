@@ -19,7 +19,6 @@ import logging
 import socket
 import struct
 from asyncio import timeout as asyncio_timeout
-from collections.abc import Generator
 
 from kasa.deviceconfig import DeviceConfig
 from kasa.exceptions import KasaException, _RetryableError
@@ -195,13 +194,6 @@ class XorEncryption:
 
     INITIALIZATION_VECTOR = 171
 
-    @staticmethod
-    def _xor_payload(unencrypted: bytes) -> Generator[int, None, None]:
-        key = XorEncryption.INITIALIZATION_VECTOR
-        for unencryptedbyte in unencrypted:
-            key = key ^ unencryptedbyte
-            yield key
-
     @staticmethod
     def encrypt(request: str) -> bytes:
         """Encrypt a request for a TP-Link Smart Home Device.
@@ -210,17 +202,21 @@ class XorEncryption:
         :return: ciphertext to be send over wire, in bytes
         """
         plainbytes = request.encode()
-        return _UNSIGNED_INT_NETWORK_ORDER.pack(len(plainbytes)) + bytes(
-            XorEncryption._xor_payload(plainbytes)
+        length = len(plainbytes)
+        # Each ciphertext byte is the xor of the initialization vector and all
+        # plaintext bytes up to it. Compute that running xor as a prefix scan
+        # over the whole payload, doubling the shift each step.
+        stream = int.from_bytes(
+            bytes((XorEncryption.INITIALIZATION_VECTOR,)) + plainbytes, "big"
+        )
+        shift = 8
+        while shift <= length * 8:
+            stream ^= stream >> shift
+            shift <<= 1
+        return (
+            _UNSIGNED_INT_NETWORK_ORDER.pack(length)
+            + stream.to_bytes(length + 1, "big")[1:]
         )
-
-    @staticmethod
-    def _xor_encrypted_payload(ciphertext: bytes) -> Generator[int, None, None]:
-        key = XorEncryption.INITIALIZATION_VECTOR
-        for cipherbyte in ciphertext:
-            plainbyte = key ^ cipherbyte
-            key = cipherbyte
-            yield plainbyte
 
     @staticmethod
     def decrypt(ciphertext: bytes) -> str:
@@ -229,7 +225,13 @@ class XorEncryption:
         :param ciphertext: encrypted response data
         :return: plaintext response
         """
-        return bytes(XorEncryption._xor_encrypted_payload(ciphertext)).decode()
+        # Each plaintext byte is the ciphertext byte xored with the previous
+        # ciphertext byte, so the key stream is the ciphertext shifted by one
+        # and the whole payload can be xored in a single integer operation.
+        length = len(ciphertext)
+        key = (bytes((XorEncryption.INITIALIZATION_VECTOR,)) + ciphertext)[:length]
+        plain = int.from_bytes(ciphertext, "big") ^ int.from_bytes(key, "big")
+        return plain.to_bytes(length, "big").decode()
 
 
 # Try to load the kasa_crypt module and if it is available
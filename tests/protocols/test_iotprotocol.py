@@ -1,6 +1,7 @@
 import asyncio
 import errno
 import importlib
+import importlib.util
 import inspect
 import json
 import logging
@@ -951,3 +952,56 @@ async def test_redact_data():
     redacted_data = redact_data(data, REDACTORS)
 
     assert redacted_data == excpected_data
+
+
+XOR_PAYLOAD_LENGTHS = sorted(
+    {0, 1, 2} | {2**k + delta for k in range(1, 13) for delta in (-1, 0, 1)}
+)
+
+
+def _xor_payload(length: int) -> str:
+    return "".join(chr(32 + (i * 7) % 95) for i in range(length))
+
+
+def _reference_xor_encrypt(request: str) -> bytes:
+    key = XorEncryption.INITIALIZATION_VECTOR
+    ciphertext = bytearray()
+    for plainbyte in request.encode():
+        key ^= plainbyte
+        ciphertext.append(key)
+    return struct.pack(">I", len(ciphertext)) + bytes(ciphertext)
+
+
+@pytest.fixture
+def fallback_xor_encryption(monkeypatch):
+    """Return XorEncryption from a copy of the module loaded without kasa_crypt."""
+    monkeypatch.setitem(sys.modules, "kasa_crypt", None)
+    origin = importlib.util.find_spec("kasa.transports.xortransport").origin
+    spec = importlib.util.spec_from_file_location(
+        "kasa.transports._xortransport_fallback", origin
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    encryption = module.XorEncryption
+    assert encryption.encrypt.__module__ == module.__name__
+    assert encryption.decrypt.__module__ == module.__name__
+    return encryption
+
+
+@pytest.mark.parametrize("length", XOR_PAYLOAD_LENGTHS)
+def test_xor_fallback_encrypt(fallback_xor_encryption, length):
+    """Test the pure python encryption against a per-byte reference."""
+    request = _xor_payload(length)
+    assert fallback_xor_encryption.encrypt(request) == _reference_xor_encrypt(request)
+
+
+@pytest.mark.parametrize("length", [*XOR_PAYLOAD_LENGTHS, 10000])
+def test_xor_fallback_decrypt(fallback_xor_encryption, length):
+    """Test that the pure python decryption reverses the encryption."""
+    request = _xor_payload(length)
+    ciphertext = _reference_xor_encrypt(request)[XorTransport.BLOCK_SIZE :]
+    assert fallback_xor_encryption.decrypt(ciphertext) == request
+    encrypted = fallback_xor_encryption.encrypt(request)
+    assert (
+        fallback_xor_encryption.decrypt(encrypted[XorTransport.BLOCK_SIZE :]) == request
+    )
@@ -569,3 +569,60 @@ async def test_no_multiple_methods(
     send_spy = mocker.spy(protocol._transport, "send")
     await protocol.query(req)
     assert send_spy.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("method", "expected_request"),
+    [
+        pytest.param(
+            "getLensMaskConfig",
+            {"method": "get", "lens_mask_config": {}},
+            id="get",
+        ),
+        pytest.param(
+            "setLensMaskConfig",
+            {"method": "set", "lens_mask_config": {}},
+            id="set",
+        ),
+        pytest.param(
+            "getSdCardFormatStatus",
+            {"method": "do", "get_sd_card_format_status": {}},
+            id="get-as-do",
+        ),
+        pytest.param(
+            "getUserID",
+            {"method": "do", "get_user_i_d": {}},
+            id="get-as-do-consecutive-capitals",
+        ),
+        pytest.param(
+            "reboot",
+            {"method": "do", "reboot": {}},
+            id="do",
+        ),
+    ],
+)
+def test_smartcam_single_request_from_method_name(method, expected_request):
+    """Test smartcam method names are mapped to the expected single requests."""
+    method_type_and_param = SmartCamProtocol._get_method_type_and_param
+    method_type_and_param.cache_clear()
+    for call in range(2):
+        single_request = SmartCamProtocol._make_smart_camera_single_request(method)
+        assert single_request.method_name == method
+        assert single_request.method_type == expected_request["method"]
+        assert single_request.request == expected_request
+        assert method_type_and_param.cache_info().hits == call
+
+
+async def test_smartcam_get_request_empty_response(mocker: MockerFixture):
+    """Test an empty response to a single get request raises a device error."""
+    transport = FakeSmartCamTransport(
+        {},
+        "dummy-name",
+        components_not_included=True,
+    )
+    protocol = SmartCamProtocol(transport=transport)
+    mocker.patch.object(transport, "send", return_value={})
+    with pytest.raises(
+        DeviceError, match="No results for get request getLensMaskConfig"
+    ):
+        await protocol.query("getLensMaskConfig")
@@ -334,6 +334,14 @@ async def test_discover_datagram_received(mocker, discovery_data):
     assert dev.host == addr
 
 
+async def test_discover_port_override_prefers_legacy_handler():
+    """Test that a discovery port override of 20002 is handled as legacy."""
+    proto = _DiscoverProtocol(port=Discover.DISCOVERY_PORT_2)
+    json_func, device_func = proto._response_handlers[Discover.DISCOVERY_PORT_2]
+    assert json_func == Discover._get_discovery_json_legacy
+    assert device_func == Discover._get_device_instance_legacy
+
+
 @pytest.mark.parametrize(("msg", "data"), INVALIDS)
 async def test_discover_invalid_responses(msg, data, mocker):
     """Verify that we don't crash whole discovery if some devices in the network are sending unexpected data."""
@@ -160,3 +160,100 @@ async def test_children_energy(dev: Device):
         assert "voltage" in energy._module_features
         assert "current" in energy._module_features
         assert "current_consumption" in energy._module_features
+
+
+@strip_iot
+async def test_strip_turn_off_single_request(dev: IotStrip, mocker):
+    """Test that switching the strip sends a single request for all outlets."""
+    await dev.turn_on()
+    await dev.update()
+    assert all(plug.is_on for plug in dev.children)
+
+    query_spy = mocker.spy(dev.protocol, "query")
+    helper_spy = mocker.spy(dev, "_query_helper")
+    await dev.turn_off()
+    query_spy.assert_called_once()
+    child_ids = helper_spy.call_args.kwargs["child_ids"]
+    assert child_ids == [plug.child_id for plug in dev.children]
+
+    await dev.update()
+    assert not any(plug.is_on for plug in dev.children)
+
+
+@strip_iot
+async def test_strip_energy_totals(dev: IotStrip, mocker):
+    """Test that the strip energy totals are summed from the outlets."""
+    if Module.Energy not in dev.modules:
+        pytest.skip(f"skipping device {dev.model} does not support energy")
+
+    energy = dev.modules[Module.Energy]
+    for attr in (
+        "current_consumption",
+        "consumption_this_month",
+        "consumption_today",
+        "consumption_total",
+    ):
+        expected = sum(
+            getattr(plug.modules[Module.Energy], attr) or 0.0 for plug in dev.children
+        )
+        assert getattr(energy, attr) == pytest.approx(expected)
+
+    first = dev.children[0].modules[Module.Energy]
+    mocker.patch.object(
+        type(first),
+        "_energy_snapshot",
+        return_value={
+            "current_consumption": 1000.0,
+            "consumption_this_month": None,
+            "consumption_today": None,
+            "consumption_total": None,
+        },
+    )
+    assert energy.current_consumption != 1000.0 * len(dev.children)
+
+    await dev.update()
+    assert energy.current_consumption == pytest.approx(1000.0 * len(dev.children))
+
+
+@strip_iot
+async def test_strip_stats_cache(dev: IotStrip, mocker, freezer):
+    """Test that summed stats are reused within the cache time."""
+    if Module.Energy not in dev.modules:
+        pytest.skip(f"skipping device {dev.model} does not support energy")
+
+    energy = dev.modules[Module.Energy]
+    sum_spy = mocker.spy(energy, "_async_get_emeter_sum")
+
+    first = await energy.get_daily_stats(year=2024, month=1)
+    assert await energy.get_daily_stats(year=2024, month=1) == first
+    assert sum_spy.call_count == 1
+
+    await energy.get_monthly_stats(year=2024)
+    assert sum_spy.call_count == 2
+
+    freezer.tick(energy.STATS_CACHE_SECS)
+    await energy.get_daily_stats(year=2024, month=1)
+    assert sum_spy.call_count == 3
+
+    # Only the entry stored after the cache time remains
+    assert list(energy._stats_cache) == [("get_daily_stats", 2024, 1, True)]
+
+
+@strip_iot
+async def test_strip_stats_cache_resolves_period(dev: IotStrip, mocker, freezer):
+    """Test that cached stats for the current period follow the date."""
+    if Module.Energy not in dev.modules:
+        pytest.skip(f"skipping device {dev.model} does not support energy")
+
+    energy = dev.modules[Module.Energy]
+    sum_spy = mocker.spy(energy, "_async_get_emeter_sum")
+
+    freezer.move_to("2024-01-31 23:59:50")
+    await energy.get_daily_stats()
+    await energy.get_daily_stats(year=2024, month=1)
+    assert sum_spy.call_count == 1
+
+    freezer.move_to("2024-02-01 00:00:10")
+    await energy.get_daily_stats()
+    assert sum_spy.call_count == 2
+    assert sum_spy.call_args.args[1] == {"year": 2024, "month": 2, "kwh": True}
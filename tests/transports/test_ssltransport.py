@@ -108,7 +108,7 @@ _LOGGER = logging.getLogger(__name__)
             SmartErrorCode.LOGIN_ERROR,
             MOCK_USER,
             MOCK_BAD_USER_OR_PWD,
-            pytest.raises(AuthenticationError),
+            pytest.raises(AuthenticationError, match="Error logging in"),
             id="bad-password",
         ),
         pytest.param(
@@ -243,6 +243,14 @@ async def test_reset(mocker):
     await transport.perform_login()
     assert transport._state is TransportState.ESTABLISHED
     assert str(transport._app_url).startswith("https://127.0.0.1:4433/app?token=")
+    client_session = transport._http_client._client_session
+    assert client_session is not None
+
+    await transport.reset()
+    assert transport._state is TransportState.LOGIN_REQUIRED
+    assert str(transport._app_url) == "https://127.0.0.1:4433/app"
+    # The http session is kept for reuse across logins
+    assert transport._http_client._client_session is client_session
 
     await transport.close()
     assert transport._state is TransportState.LOGIN_REQUIRED